@@ -29,7 +29,7 @@ from collections import OrderedDict
 import flask
 from flask_babel import gettext as _
 
-from . import db, calibre_db, converter, uploader, constants, dep_check
+from . import calibre_db, converter, uploader, constants, dep_check
 from .render_template import render_title_template
 from .usermanagement import user_login_required
 
@@ -77,9 +77,7 @@ def collect_stats():
 @about.route("/stats")
 @user_login_required
 def stats():
-    counter = calibre_db.session.query(db.Books).count()
-    authors = calibre_db.session.query(db.Authors).count()
-    categories = calibre_db.session.query(db.Tags).count()
-    series = calibre_db.session.query(db.Series).count()
-    return render_title_template('stats.html', bookcounter=counter, authorcounter=authors, versions=collect_stats(),
-                                 categorycounter=categories, seriecounter=series, title=_("Statistics"), page="stat")
+    library_stats = calibre_db.get_library_stats()
+    return render_title_template('stats.html', bookcounter=library_stats.books, authorcounter=library_stats.authors,
+                                 versions=collect_stats(), categorycounter=library_stats.categories,
+                                 seriecounter=library_stats.series, title=_("Statistics"), page="stat")
@@ -492,9 +492,10 @@ def edit_list_user(param):
                             user.role |= value
                         elif vals['value'] == 'false':
                             if value == constants.ROLE_ADMIN:
-                                if not ub.session.query(ub.User). \
-                                    filter(ub.User.role.op('&')(constants.ROLE_ADMIN) == constants.ROLE_ADMIN,
-                                           ub.User.id != user.id).count():
+                                admin_query = ub.session.query(ub.User).filter(
+                                    ub.User.role.op('&')(constants.ROLE_ADMIN) == constants.ROLE_ADMIN,
+                                    ub.User.id != user.id)
+                                if not ub.session.query(admin_query.exists()).scalar():
                                     return make_response(
                                         jsonify([{'type': "danger",
                                                      'message': _("No admin user remaining, can't remove admin role",
@@ -686,7 +687,7 @@ def delete_domain():
         ub.session.query(ub.Registration).filter(ub.Registration.id == domain_id).delete()
         ub.session_commit("Registering Domains deleted {}".format(domain_id))
         # If last domain was deleted, add all domains by default
-        if not ub.session.query(ub.Registration).filter(ub.Registration.allow == 1).count():
+        if not ub.session.query(ub.session.query(ub.Registration).filter(ub.Registration.allow == 1).exists()).scalar():
             new_domain = ub.Registration(domain="%.%", allow=1)
             ub.session.add(new_domain)
             ub.session_commit("Last Registering Domain deleted, added *.* as default")
@@ -1985,8 +1986,9 @@ def _handle_new_user(to_save, content, languages, translations, kobo_support):
 
 
 def _delete_user(content):
-    if ub.session.query(ub.User).filter(ub.User.role.op('&')(constants.ROLE_ADMIN) == constants.ROLE_ADMIN,
-                                        ub.User.id != content.id).count():
+    admin_query = ub.session.query(ub.User).filter(ub.User.role.op('&')(constants.ROLE_ADMIN) == constants.ROLE_ADMIN,
+                                                   ub.User.id != content.id)
+    if ub.session.query(admin_query.exists()).scalar():
         if content.name != "Guest":
             # Delete all books in shelfs belonging to user, all shelfs of user, downloadstat of user, read status
             # and user itself
@@ -2025,8 +2027,10 @@ def _handle_edit_user(to_save, content, languages, translations, kobo_support):
             flash(str(ex), category="error")
         return redirect(url_for('admin.admin'))
     else:
-        if not ub.session.query(ub.User).filter(ub.User.role.op('&')(constants.ROLE_ADMIN) == constants.ROLE_ADMIN,
-                                                ub.User.id != content.id).count() and 'admin_role' not in to_save:
+        admin_query = ub.session.query(ub.User).filter(
+            ub.User.role.op('&')(constants.ROLE_ADMIN) == constants.ROLE_ADMIN,
+            ub.User.id != content.id)
+        if not ub.session.query(admin_query.exists()).scalar() and 'admin_role' not in to_save:
             log.warning("No admin user remaining, can't remove admin role from {}".format(content.name))
             flash(_("No admin user remaining, can't remove admin role"), category="error")
             return redirect(url_for('admin.admin'))
@@ -570,9 +570,12 @@ def get_encryption_key(key_path):
     generate = True
     error = ""
     key = None
-    if os.path.exists(key_file) and os.path.getsize(key_file) > 32:
+    try:
         with open(key_file, "rb") as f:
             key = f.read()
+    except FileNotFoundError:
+        pass
+    if key and len(key) > 32:
         try:
             urlsafe_b64decode(key)
             generate = False
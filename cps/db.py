@@ -20,6 +20,7 @@
 import os
 import re
 import json
+import random
 from datetime import datetime, timezone
 from urllib.parse import quote
 import unidecode
@@ -30,7 +31,7 @@ from sqlite3 import OperationalError as sqliteOperationalError
 from sqlalchemy import create_engine
 from sqlalchemy import Table, Column, ForeignKey, CheckConstraint
 from sqlalchemy import String, Integer, Boolean, TIMESTAMP, Float
-from sqlalchemy.orm import relationship, sessionmaker, scoped_session
+from sqlalchemy.orm import relationship, sessionmaker, scoped_session, selectinload
 from sqlalchemy.orm.collections import InstrumentedList
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from sqlalchemy.exc import OperationalError
@@ -751,6 +752,18 @@ class CalibreDB:
     def get_book_format(self, book_id, file_format):
         return self.session.query(Data).filter(Data.book == book_id).filter(Data.format == file_format).first()
 
+    # Count books, authors, tags and series with a single query instead of one round-trip per table
+    def get_library_stats(self):
+        counters = []
+        for name, table in (('books', Books), ('authors', Authors), ('categories', Tags), ('series', Series)):
+            count_query = self.session.query(func.count(table.id))
+            # scalar_subquery was introduced in SQLAlchemy 1.4, as_scalar is its predecessor
+            if hasattr(count_query, 'scalar_subquery'):
+                counters.append(count_query.scalar_subquery().label(name))
+            else:
+                counters.append(count_query.as_scalar().label(name))
+        return self.session.query(*counters).one()
+
     def set_metadata_dirty(self, book_id):
         if not self.session.query(Metadata_Dirtied).filter(Metadata_Dirtied.book == book_id).one_or_none():
             self.session.add(Metadata_Dirtied(book_id))
@@ -846,6 +859,47 @@ class CalibreDB:
             outcome.reverse()
         return outcome[offset:offset + limit]
 
+    # Relations shown in book lists are loaded with one batched query each instead of one query per book
+    @staticmethod
+    def book_list_options():
+        return (selectinload(Books.authors), selectinload(Books.data),
+                selectinload(Books.ratings), selectinload(Books.series))
+
+    # Sample the ids of all visible books and load only the picked ones, instead of letting the database
+    # order the whole filtered library by random()
+    def get_random_books(self, config_read_column, limit, allow_show_archived=False):
+        book_ids = [book.id for book in (self.session.query(Books.id)
+                                         .filter(self.common_filters(allow_show_archived)).all())]
+        picked_ids = random.sample(book_ids, min(int(limit), len(book_ids)))
+        entries = (self.generate_linked_query(config_read_column, Books)
+                   .filter(Books.id.in_(picked_ids))
+                   .options(*self.book_list_options())
+                   .all())
+        random.shuffle(entries)
+        return entries
+
+    # Load one page of the download ranking with a single query, downloads of books which no longer exist
+    # or are not visible are removed from the ranking
+    def get_hot_books(self, config_read_column, order, offset, limit):
+        hot_books = (ub.session.query(ub.Downloads.book_id, func.count(ub.Downloads.book_id))
+                     .group_by(ub.Downloads.book_id)
+                     .order_by(*order)
+                     .offset(offset).limit(limit).all())
+        book_ids = [book.book_id for book in hot_books]
+        books = (self.generate_linked_query(config_read_column, Books)
+                 .filter(self.common_filters())
+                 .filter(Books.id.in_(book_ids))
+                 .options(*self.book_list_options())
+                 .all())
+        found_books = {book.Books.id: book for book in books}
+        entries = list()
+        for book_id in book_ids:
+            if book_id in found_books:
+                entries.append(found_books[book_id])
+            else:
+                ub.delete_download(book_id)
+        return entries
+
     # Fill indexpage with all requested data from database
     def fill_indexpage(self, page, pagesize, database, db_filter, order,
                        join_archive_read=False, config_read_column=0, *join):
@@ -856,10 +910,7 @@ class CalibreDB:
                                            join_archive_read, config_read_column, *join):
         pagesize = pagesize or self.config.config_books_per_page
         if current_user.show_detail_random():
-            random_query = self.generate_linked_query(config_read_column, database)
-            randm = (random_query.filter(self.common_filters(allow_show_archived))
-                     .order_by(func.random())
-                     .limit(self.config.config_random_books).all())
+            randm = self.get_random_books(config_read_column, self.config.config_random_books, allow_show_archived)
         else:
             randm = false()
         if join_archive_read:
@@ -889,7 +940,8 @@ class CalibreDB:
         pagination = list()
         try:
             pagination = Pagination(page, pagesize, query.count())
-            entries = query.order_by(*order).offset(off).limit(pagesize).all()
+            entries = (query.options(*self.book_list_options())
+                       .order_by(*order).offset(off).limit(pagesize).all())
         except Exception as ex:
             log.error_or_exception(ex)
         # display authors in right order
@@ -956,7 +1008,8 @@ class CalibreDB:
             .filter(and_(Books.authors.any(and_(*q)), func.lower(Books.title).ilike("%" + title + "%"))).first()
 
     def search_query(self, term, config, *join):
-        strip_whitespaces(term).lower()
+        term = strip_whitespaces(term).lower()
+        like_term = "%" + term + "%"
         self.create_functions()
         # self.session.connection().connection.connection.create_function("lower", 1, lcase)
         q = list()
@@ -974,17 +1027,17 @@ class CalibreDB:
             query = query.outerjoin(join[0])
 
         cc = self.get_cc_columns(config, filter_config_custom_read=True)
-        filter_expression = [Books.tags.any(func.lower(Tags.name).ilike("%" + term + "%")),
-                             Books.series.any(func.lower(Series.name).ilike("%" + term + "%")),
+        filter_expression = [Books.tags.any(func.lower(Tags.name).ilike(like_term)),
+                             Books.series.any(func.lower(Series.name).ilike(like_term)),
                              Books.authors.any(and_(*q)),
-                             Books.publishers.any(func.lower(Publishers.name).ilike("%" + term + "%")),
-                             func.lower(Books.title).ilike("%" + term + "%")]
+                             Books.publishers.any(func.lower(Publishers.name).ilike(like_term)),
+                             func.lower(Books.title).ilike(like_term)]
         for c in cc:
             if c.datatype not in ["datetime", "rating", "bool", "int", "float"]:
                 filter_expression.append(
                     getattr(Books,
                             'custom_column_' + str(c.id)).any(
-                        func.lower(cc_classes[c.id].value).ilike("%" + term + "%")))
+                        func.lower(cc_classes[c.id].value).ilike(like_term)))
         return query.filter(self.common_filters(True)).filter(or_(*filter_expression))
 
     def get_cc_columns(self, config, filter_config_custom_read=False):
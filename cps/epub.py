@@ -18,17 +18,43 @@
 
 import os
 import zipfile
+from functools import lru_cache
 from lxml import etree
 
 from . import isoLanguages, cover
 from . import config, logger
 from .helper import split_authors
-from .epub_helper import get_content_opf, default_ns
+from .epub_helper import get_content_opf, get_content_opf_name, OPF
 from .constants import BookMeta
 from .string_helper import strip_whitespaces
 
 log = logger.create()
 
+EPUB_NS = {
+    'n': 'urn:oasis:names:tc:opendocument:xmlns:container',
+    'pkg': 'http://www.idpf.org/2007/opf',
+    'dc': 'http://purl.org/dc/elements/1.1/'
+}
+
+# XPath expressions are compiled once instead of for every parsed epub
+_METADATA_XPATH = etree.XPath('/pkg:package/pkg:metadata', namespaces=EPUB_NS)
+_DC_ELEMENT_XPATHS = {s: etree.XPath('dc:%s/text()' % s, namespaces=EPUB_NS)
+                      for s in ['title', 'description', 'creator', 'language', 'subject', 'publisher', 'date']}
+_DC_IDENTIFIER_XPATH = etree.XPath('dc:identifier', namespaces=EPUB_NS)
+_DESCRIPTION_XPATH = etree.XPath("//*[local-name() = 'description']/text()")
+_SERIES_XPATH = etree.XPath("/pkg:package/pkg:metadata/pkg:meta[@name='calibre:series']/@content",
+                            namespaces=EPUB_NS)
+_SERIES_INDEX_XPATH = etree.XPath("/pkg:package/pkg:metadata/pkg:meta[@name='calibre:series_index']/@content",
+                                  namespaces=EPUB_NS)
+_COVER_IMAGE_XPATH = etree.XPath("/pkg:package/pkg:manifest/pkg:item[@id='cover-image']/@href", namespaces=EPUB_NS)
+_META_COVER_XPATH = etree.XPath("/pkg:package/pkg:metadata/pkg:meta[@name='cover']/@content", namespaces=EPUB_NS)
+_ITEM_BY_ID_XPATH = etree.XPath("/pkg:package/pkg:manifest/pkg:item[@id=$item]/@href", namespaces=EPUB_NS)
+_ITEM_BY_PROPERTIES_XPATH = etree.XPath("/pkg:package/pkg:manifest/pkg:item[@properties=$item]/@href",
+                                        namespaces=EPUB_NS)
+_GUIDE_REFERENCE_XPATH = etree.XPath("/pkg:package/pkg:guide/pkg:reference/@href", namespaces=EPUB_NS)
+_IMG_SRC_XPATH = etree.XPath("//*[local-name() = 'img']/@src")
+_HREF_ATTRIBUTE_XPATH = etree.XPath("//attribute::*[contains(local-name(), 'href')]")
+
 
 def _extract_cover(zip_file, cover_file, cover_path, tmp_file_name):
     if cover_file is None:
@@ -52,37 +78,38 @@ def get_epub_layout(book, book_data):
                                               book.path, book_data.name + "." + book_data.format.lower()))
 
     try:
-        tree, __ = get_content_opf(file_path, default_ns)
-        p = tree.xpath('/pkg:package/pkg:metadata', namespaces=default_ns)[0]
-
-        layout = p.xpath('pkg:meta[@property="rendition:layout"]/text()', namespaces=default_ns)
+        return _get_epub_layout(file_path, os.path.getmtime(file_path))
     except (etree.XMLSyntaxError, KeyError, IndexError, OSError, UnicodeDecodeError) as e:
         log.error("Could not parse epub metadata of book {} during kobo sync: {}".format(book.id, e))
-        layout = []
-
-    if len(layout) == 0:
         return None
-    else:
-        return layout[0]
 
 
-def get_epub_info(tmp_file_path, original_file_name, original_file_extension, no_cover_processing):
-    ns = {
-        'n': 'urn:oasis:names:tc:opendocument:xmlns:container',
-        'pkg': 'http://www.idpf.org/2007/opf',
-        'dc': 'http://purl.org/dc/elements/1.1/'
-    }
+# Every kobo sync asks for the layout of all synced books, the modification time as part of the cache key
+# invalidates the entry as soon as the epub file is changed
+@lru_cache(maxsize=1024)
+def _get_epub_layout(file_path, mtime):
+    with zipfile.ZipFile(file_path) as epub_zip:
+        with epub_zip.open(get_content_opf_name(epub_zip, EPUB_NS)) as cf:
+            # The layout is part of the metadata block, stop before the manifest and spine are parsed
+            for __, element in etree.iterparse(cf, events=('end',), tag=(OPF + 'meta', OPF + 'metadata')):
+                if element.tag == OPF + 'metadata':
+                    break
+                if element.get('property') == 'rendition:layout' and element.text:
+                    return element.text
+    return None
+
 
-    tree, cf_name = get_content_opf(tmp_file_path, ns)
+def get_epub_info(tmp_file_path, original_file_name, original_file_extension, no_cover_processing):
+    tree, cf_name = get_content_opf(tmp_file_path, EPUB_NS)
 
     cover_path = os.path.dirname(cf_name)
 
-    p = tree.xpath('/pkg:package/pkg:metadata', namespaces=ns)[0]
+    p = _METADATA_XPATH(tree)[0]
 
     epub_metadata = {}
 
-    for s in ['title', 'description', 'creator', 'language', 'subject', 'publisher', 'date']:
-        tmp = p.xpath('dc:%s/text()' % s, namespaces=ns)
+    for s, dc_xpath in _DC_ELEMENT_XPATHS.items():
+        tmp = dc_xpath(p)
         if len(tmp) > 0:
             if s == 'creator':
                 epub_metadata[s] = ' & '.join(split_authors(tmp))
@@ -105,7 +132,7 @@ def get_epub_info(tmp_file_path, original_file_name, original_file_extension, no
         epub_metadata['date'] = ''
 
     if epub_metadata['description'] == 'Unknown':
-        description = tree.xpath("//*[local-name() = 'description']/text()")
+        description = _DESCRIPTION_XPATH(tree)
         if len(description) > 0:
             epub_metadata['description'] = description
         else:
@@ -114,16 +141,16 @@ def get_epub_info(tmp_file_path, original_file_name, original_file_extension, no
     lang = epub_metadata['language'].split('-', 1)[0].lower()
     epub_metadata['language'] = isoLanguages.get_lang3(lang)
 
-    epub_metadata = parse_epub_series(ns, tree, epub_metadata)
+    epub_metadata = parse_epub_series(tree, epub_metadata)
 
     epub_zip = zipfile.ZipFile(tmp_file_path)
     if not no_cover_processing:
-        cover_file = parse_epub_cover(ns, tree, epub_zip, cover_path, tmp_file_path)
+        cover_file = parse_epub_cover(tree, epub_zip, cover_path, tmp_file_path)
     else:
         cover_file = None
 
     identifiers = []
-    for node in p.xpath('dc:identifier', namespaces=ns):
+    for node in _DC_IDENTIFIER_XPATH(p):
         try:
             identifier_name = node.attrib.values()[-1]
         except IndexError:
@@ -154,22 +181,20 @@ def get_epub_info(tmp_file_path, original_file_name, original_file_extension, no
         identifiers=identifiers)
 
 
-def parse_epub_cover(ns, tree, epub_zip, cover_path, tmp_file_path):
-    cover_section = tree.xpath("/pkg:package/pkg:manifest/pkg:item[@id='cover-image']/@href", namespaces=ns)
+def parse_epub_cover(tree, epub_zip, cover_path, tmp_file_path):
+    cover_section = _COVER_IMAGE_XPATH(tree)
     for cs in cover_section:
         cover_file = _extract_cover(epub_zip, cs, cover_path, tmp_file_path)
         if cover_file:
             return cover_file
 
-    meta_cover = tree.xpath("/pkg:package/pkg:metadata/pkg:meta[@name='cover']/@content", namespaces=ns)
+    meta_cover = _META_COVER_XPATH(tree)
     if len(meta_cover) > 0:
-        cover_section = tree.xpath(
-            "/pkg:package/pkg:manifest/pkg:item[@id='"+meta_cover[0]+"']/@href", namespaces=ns)
+        cover_section = _ITEM_BY_ID_XPATH(tree, item=meta_cover[0])
         if not cover_section:
-            cover_section = tree.xpath(
-                "/pkg:package/pkg:manifest/pkg:item[@properties='" + meta_cover[0] + "']/@href", namespaces=ns)
+            cover_section = _ITEM_BY_PROPERTIES_XPATH(tree, item=meta_cover[0])
     else:
-        cover_section = tree.xpath("/pkg:package/pkg:guide/pkg:reference/@href", namespaces=ns)
+        cover_section = _GUIDE_REFERENCE_XPATH(tree)
 
     cover_file = None
     for cs in cover_section:
@@ -177,10 +202,10 @@ def parse_epub_cover(ns, tree, epub_zip, cover_path, tmp_file_path):
             markup = epub_zip.read(os.path.join(cover_path, cs))
             markup_tree = etree.fromstring(markup)
             # no matter xhtml or html with no namespace
-            img_src = markup_tree.xpath("//*[local-name() = 'img']/@src")
+            img_src = _IMG_SRC_XPATH(markup_tree)
             # Alternative image source
             if not len(img_src):
-                img_src = markup_tree.xpath("//attribute::*[contains(local-name(), 'href')]")
+                img_src = _HREF_ATTRIBUTE_XPATH(markup_tree)
             if len(img_src):
                 # img_src maybe start with "../"" so fullpath join then relpath to cwd
                 filename = os.path.relpath(os.path.join(os.path.dirname(os.path.join(cover_path, cover_section[0])),
@@ -193,14 +218,14 @@ def parse_epub_cover(ns, tree, epub_zip, cover_path, tmp_file_path):
     return cover_file
 
 
-def parse_epub_series(ns, tree, epub_metadata):
-    series = tree.xpath("/pkg:package/pkg:metadata/pkg:meta[@name='calibre:series']/@content", namespaces=ns)
+def parse_epub_series(tree, epub_metadata):
+    series = _SERIES_XPATH(tree)
     if len(series) > 0:
         epub_metadata['series'] = series[0]
     else:
         epub_metadata['series'] = ''
 
-    series_id = tree.xpath("/pkg:package/pkg:metadata/pkg:meta[@name='calibre:series_index']/@content", namespaces=ns)
+    series_id = _SERIES_INDEX_XPATH(tree)
     if len(series_id) > 0:
         epub_metadata['series_id'] = series_id[0]
     else:
@@ -53,16 +53,20 @@ def updateEpub(src, dest, filename, data, ):
         zf.writestr(filename, data)
 
 
-def get_content_opf(file_path, ns=None):
+def get_content_opf_name(epubZip, ns=None):
     if ns is None:
         ns = default_ns
-    epubZip = zipfile.ZipFile(file_path)
     txt = epubZip.read('META-INF/container.xml')
     tree = etree.fromstring(txt)
-    cf_name = tree.xpath('n:rootfiles/n:rootfile/@full-path', namespaces=ns)[0]
-    cf = epubZip.read(cf_name)
+    return tree.xpath('n:rootfiles/n:rootfile/@full-path', namespaces=ns)[0]
+
 
-    return etree.fromstring(cf), cf_name
+def get_content_opf(file_path, ns=None):
+    with zipfile.ZipFile(file_path) as epubZip:
+        cf_name = get_content_opf_name(epubZip, ns)
+        # feed the parser directly from the decompressing zip stream instead of reading the whole entry first
+        with epubZip.open(cf_name) as cf:
+            return etree.parse(cf).getroot(), cf_name
 
 
 def create_new_metadata_backup(book,  custom_columns, export_language, translated_cover_name, lang_type=3):
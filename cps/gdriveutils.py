@@ -19,7 +19,6 @@
 import os
 import json
 import shutil
-import chardet
 import ssl
 import sqlite3
 import mimetypes
@@ -68,6 +67,7 @@ except ImportError as err:
 
 from . import logger, cli_param, config, db
 from .constants import CONFIG_DIR as _CONFIG_DIR
+from .string_helper import detect_encoding
 
 
 SETTINGS_YAML  = os.path.join(_CONFIG_DIR, 'settings.yaml')
@@ -655,8 +655,9 @@ def do_gdrive_download(df, headers, convert_encoding=False):
             resp, content = df.auth.Get_Http_Object().request(download_url, headers=headers)
             if resp.status == 206:
                 if convert_encoding:
-                    result = chardet.detect(content)
-                    content = content.decode(result['encoding']).encode('utf-8')
+                    encoding = detect_encoding(content)
+                    if encoding != 'utf-8':
+                        content = content.decode(encoding).encode('utf-8')
                 yield content
             else:
                 log.warning('An error occurred: {}'.format(resp))
@@ -196,18 +196,6 @@ def check_send_to_ereader(entry):
         return None
 
 
-# Check if a reader is existing for any of the book formats, if not, return empty list, otherwise return
-# list with supported formats
-def check_read_formats(entry):
-    extensions_reader = {'TXT', 'PDF', 'EPUB', 'KEPUB', 'CBZ', 'CBT', 'CBR', 'DJVU', 'DJV'}
-    book_formats = list()
-    if len(entry.data):
-        for ele in iter(entry.data):
-            if ele.format.upper() in extensions_reader:
-                book_formats.append(ele.format.lower())
-    return book_formats
-
-
 # Files are processed in the following order/priority:
 # 1: If epub file is existing, it's directly send to eReader email,
 # 2: If mobi file is existing, it's converted and send to eReader email,
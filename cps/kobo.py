@@ -154,7 +154,8 @@ def HandleSyncRequest():
         log.debug('Kobo: Received unproxied request, changed request port to external server port')
 
     # if no books synced don't respect sync_token
-    if not ub.session.query(ub.KoboSyncedBooks).filter(ub.KoboSyncedBooks.user_id == current_user.id).count():
+    if not ub.session.query(ub.session.query(ub.KoboSyncedBooks)
+                            .filter(ub.KoboSyncedBooks.user_id == current_user.id).exists()).scalar():
         sync_token.books_last_modified = datetime.min
         sync_token.books_last_created = datetime.min
         sync_token.reading_state_last_modified = datetime.min
@@ -27,8 +27,8 @@ from sqlalchemy.sql.expression import or_, and_, true
 # Add the current book id to kobo_synced_books table for current user, if entry is already present,
 # do nothing (safety precaution)
 def add_synced_books(book_id):
-    is_present = ub.session.query(ub.KoboSyncedBooks).filter(ub.KoboSyncedBooks.book_id == book_id)\
-        .filter(ub.KoboSyncedBooks.user_id == current_user.id).count()
+    is_present = ub.session.query(ub.session.query(ub.KoboSyncedBooks).filter(ub.KoboSyncedBooks.book_id == book_id)
+                                  .filter(ub.KoboSyncedBooks.user_id == current_user.id).exists()).scalar()
     if not is_present:
         synced_book = ub.KoboSyncedBooks()
         synced_book.user_id = current_user.id
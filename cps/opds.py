@@ -110,8 +110,7 @@ def feed_new():
 def feed_discover():
     if not auth.current_user().check_visibility(constants.SIDEBAR_RANDOM):
         abort(404)
-    query = calibre_db.generate_linked_query(config.config_read_column, db.Books)
-    entries = query.filter(calibre_db.common_filters()).order_by(func.random()).limit(config.config_books_per_page)
+    entries = calibre_db.get_random_books(config.config_read_column, config.config_books_per_page)
     pagination = Pagination(1, config.config_books_per_page, int(config.config_books_per_page))
     cc = calibre_db.get_cc_columns(config, filter_config_custom_read=True)
     return render_xml_template('feed.xml', entries=entries, pagination=pagination, cc=cc)
@@ -137,18 +136,8 @@ def feed_hot():
     if not auth.current_user().check_visibility(constants.SIDEBAR_HOT):
         abort(404)
     off = request.args.get("offset") or 0
-    all_books = ub.session.query(ub.Downloads, func.count(ub.Downloads.book_id)).order_by(
-        func.count(ub.Downloads.book_id).desc()).group_by(ub.Downloads.book_id)
-    hot_books = all_books.offset(off).limit(config.config_books_per_page)
-    entries = list()
-    for book in hot_books:
-        query = calibre_db.generate_linked_query(config.config_read_column, db.Books)
-        download_book = query.filter(calibre_db.common_filters()).filter(
-            book.Downloads.book_id == db.Books.id).first()
-        if download_book:
-            entries.append(download_book)
-        else:
-            ub.delete_download(book.Downloads.book_id)
+    entries = calibre_db.get_hot_books(config.config_read_column, [func.count(ub.Downloads.book_id).desc()],
+                                       int(off), config.config_books_per_page)
     num_books = entries.__len__()
     pagination = Pagination((int(off) / (int(config.config_books_per_page)) + 1),
                             config.config_books_per_page, num_books)
@@ -462,11 +451,7 @@ def get_metadata_calibre_companion(uuid, library):
 @opds.route("/opds/stats")
 @requires_basic_auth_if_no_ano
 def get_database_stats():
-    stat = dict()
-    stat['books'] = calibre_db.session.query(db.Books).count()
-    stat['authors'] = calibre_db.session.query(db.Authors).count()
-    stat['categories'] = calibre_db.session.query(db.Tags).count()
-    stat['series'] = calibre_db.session.query(db.Series).count()
+    stat = calibre_db.get_library_stats()._asdict()
     return make_response(jsonify(stat))
 
 
@@ -16,6 +16,40 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 import re
+import codecs
+
+import chardet  # dependency of requests
+
+# utf-32 marks have to be checked before utf-16 marks, as they start with the same bytes
+_BYTE_ORDER_MARKS = ((codecs.BOM_UTF8, 'utf-8-sig'),
+                     (codecs.BOM_UTF32_LE, 'utf-32'),
+                     (codecs.BOM_UTF32_BE, 'utf-32'),
+                     (codecs.BOM_UTF16_LE, 'utf-16'),
+                     (codecs.BOM_UTF16_BE, 'utf-16'))
+_DETECT_SAMPLE_SIZE = 65536
+# chardet reports the smallest charset matching the sample, decode with the commonly used superset instead
+_ENCODING_SUPERSETS = {'gb2312': 'gb18030', 'gbk': 'gb18030'}
+
+
+# Returns 'utf-8' only if the whole content is valid utf-8, so callers can use such content without decoding it
+def detect_encoding(rawdata):
+    # chardet is slow on large files, so check for a byte order mark and valid utf-8 first
+    # and only let chardet guess from the beginning of the content
+    for bom, encoding in _BYTE_ORDER_MARKS:
+        if rawdata.startswith(bom):
+            return encoding
+    try:
+        rawdata.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    encoding = chardet.detect(rawdata[:_DETECT_SAMPLE_SIZE])['encoding']
+    # the content is not valid utf-8, so an ascii guess only means the sample contained no special characters
+    if (not encoding or encoding.lower() == 'ascii') and len(rawdata) > _DETECT_SAMPLE_SIZE:
+        encoding = chardet.detect(rawdata)['encoding']
+    if not encoding:
+        return 'latin-1'
+    return _ENCODING_SUPERSETS.get(encoding.lower(), encoding)
 
 
 def strip_whitespaces(text):
@@ -506,8 +506,8 @@ class Downloads(Base):
     __tablename__ = 'downloads'
 
     id = Column(Integer, primary_key=True)
-    book_id = Column(Integer)
-    user_id = Column(Integer, ForeignKey('user.id'))
+    book_id = Column(Integer, index=True)
+    user_id = Column(Integer, ForeignKey('user.id'), index=True)
 
     def __repr__(self):
         return '<Download %r' % self.book_id
@@ -556,7 +556,7 @@ class Thumbnail(Base):
     __tablename__ = 'thumbnail'
 
     id = Column(Integer, primary_key=True)
-    entity_id = Column(Integer)
+    entity_id = Column(Integer, index=True)
     uuid = Column(String, default=lambda: str(uuid.uuid4()), unique=True)
     format = Column(String, default='jpeg')
     type = Column(SmallInteger, default=constants.THUMBNAIL_TYPE_COVER)
@@ -601,6 +601,20 @@ def migrate_user_session_table(engine, _session):
             trans.commit()
 
 
+# Add indexes for the download ranking and thumbnail lookups, create_all doesn't add them to existing tables
+def migrate_table_indexes(engine, _session):
+    try:
+        with engine.connect() as conn:
+            trans = conn.begin()
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_downloads_book_id ON downloads (book_id)"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_downloads_user_id ON downloads (user_id)"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_thumbnail_entity_id ON thumbnail (entity_id)"))
+            trans.commit()
+    except exc.OperationalError:  # Database is not writeable
+        print('Settings database is not writeable. Exiting...')
+        sys.exit(2)
+
+
 # Migrate database to current version, has to be updated after every database change. Currently, migration from
 # maybe 4/5 versions back to current should work.
 # Migration is done by checking if relevant columns are existing, and then adding rows with SQL commands
@@ -609,6 +623,7 @@ def migrate_Database(_session):
     add_missing_tables(engine, _session)
     migrate_registration_table(engine, _session)
     migrate_user_session_table(engine, _session)
+    migrate_table_indexes(engine, _session)
 
 
 def clean_database(_session):
@@ -21,7 +21,6 @@
 import os
 import json
 import mimetypes
-import chardet  # dependency of requests
 import copy
 from importlib.metadata import metadata
 
@@ -46,7 +45,7 @@ from .search import render_search_results, render_adv_search_results
 from .gdriveutils import getFileFromEbooksFolder, do_gdrive_download
 from .helper import check_valid_domain, check_email, check_username, \
     get_book_cover, get_series_cover_thumbnail, get_download_link, send_mail, generate_random_password, \
-    send_registration_mail, check_send_to_ereader, check_read_formats, tags_filters, reset_password, valid_email, \
+    send_registration_mail, check_send_to_ereader, tags_filters, reset_password, valid_email, \
     edit_book_read_status, valid_password
 from .pagination import Pagination
 from .redirect import get_redirect_location
@@ -59,7 +58,7 @@ from . import limiter
 from .services.worker import WorkerThread
 from .tasks_status import render_task_status
 from .usermanagement import user_login_required
-from .string_helper import strip_whitespaces
+from .string_helper import strip_whitespaces, detect_encoding
 
 
 feature_support = {
@@ -461,26 +460,12 @@ def render_hot_books(page, order):
             #        order[0][0].compare(func.count(ub.Downloads.book_id).asc())):
             order = [func.count(ub.Downloads.book_id).desc()], 'hotdesc'
         if current_user.show_detail_random():
-            random_query = calibre_db.generate_linked_query(config.config_read_column, db.Books)
-            random = (random_query.filter(calibre_db.common_filters())
-                     .order_by(func.random())
-                     .limit(config.config_random_books).all())
+            random = calibre_db.get_random_books(config.config_read_column, config.config_random_books)
         else:
             random = false()
 
         off = int(int(config.config_books_per_page) * (page - 1))
-        all_books = ub.session.query(ub.Downloads, func.count(ub.Downloads.book_id)) \
-            .order_by(*order[0]).group_by(ub.Downloads.book_id)
-        hot_books = all_books.offset(off).limit(config.config_books_per_page)
-        entries = list()
-        for book in hot_books:
-            query = calibre_db.generate_linked_query(config.config_read_column, db.Books)
-            download_book = query.filter(calibre_db.common_filters()).filter(
-                book.Downloads.book_id == db.Books.id).first()
-            if download_book:
-                entries.append(download_book)
-            else:
-                ub.delete_download(book.Downloads.book_id)
+        entries = calibre_db.get_hot_books(config.config_read_column, order[0], off, config.config_books_per_page)
         num_books = entries.__len__()
         pagination = Pagination(page, config.config_books_per_page, num_books)
         return render_title_template('index.html', random=random, entries=entries, pagination=pagination,
@@ -1216,15 +1201,18 @@ def serve_book(book_id, book_format, anyname):
             try:
                 rawdata = open(os.path.join(config.get_book_path(), book.path, data.name + "." + book_format),
                                "rb").read()
-                result = chardet.detect(rawdata)
+                encoding = detect_encoding(rawdata)
                 try:
-                    text_data = rawdata.decode(result['encoding']).encode('utf-8')
+                    if encoding == 'utf-8':
+                        text_data = rawdata
+                    else:
+                        text_data = rawdata.decode(encoding).encode('utf-8')
                 except UnicodeDecodeError as e:
                     log.error("Encoding error in text file {}: {}".format(book.id, e))
                     if "surrogate" in e.reason:
-                        text_data = rawdata.decode(result['encoding'], 'surrogatepass').encode('utf-8', 'surrogatepass')
+                        text_data = rawdata.decode(encoding, 'surrogatepass').encode('utf-8', 'surrogatepass')
                     else:
-                        text_data = rawdata.decode(result['encoding'], 'ignore').encode('utf-8', 'ignore')
+                        text_data = rawdata.decode(encoding, 'ignore').encode('utf-8', 'ignore')
                 return make_response(text_data)
             except FileNotFoundError:
                 log.error("File Not Found")
@@ -1648,17 +1636,17 @@ def show_book(book_id):
         entry.ordered_authors = calibre_db.order_authors([entry])
 
         entry.email_share_list = check_send_to_ereader(entry)
-        entry.reader_list = check_read_formats(entry)
 
+        entry.reader_list = []
         entry.reader_list_sizes = dict()
-        for data in entry.data:
-            if data.format.lower() in entry.reader_list:
-                entry.reader_list_sizes[data.format.lower()] = data.uncompressed_size
-
         entry.audio_entries = []
-        for media_format in entry.data:
-            if media_format.format.lower() in constants.EXTENSIONS_AUDIO:
-                entry.audio_entries.append(media_format.format.lower())
+        for data in entry.data:
+            book_format = data.format.lower()
+            if book_format in constants.EXTENSIONS_READER:
+                entry.reader_list.append(book_format)
+                entry.reader_list_sizes[book_format] = data.uncompressed_size
+            if book_format in constants.EXTENSIONS_AUDIO:
+                entry.audio_entries.append(book_format)
 
         return render_title_template('detail.html',
                                      entry=entry,